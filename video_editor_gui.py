@@ -11,21 +11,41 @@ Features:
 - Right properties panel with 2 collapsible sections: Adjustments and Color Mixer
 - Sliders for brightness, contrast, shadows, highlights, whites, blacks, levels
 - Sliders for Red, Green, Blue in Color Mixer
-- Responsive layout using PanedWindow and grid weights
+- Responsive layout using PanedWindow and pack
 - Placeholder functions for all actions (no actual video processing)
 """
 
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from tkinter import messagebox, filedialog
+from functools import partial
+from bisect import bisect_left
 
+IMPORT_FILETYPES = (("Video Files", "*.mp4 *.avi *.mov *.mkv"), ("All Files", "*.*"))
+EXPORT_FILETYPES = (("MP4 Video", "*.mp4"), ("All Files", "*.*"))
 
 # -------------------------
 # Helper / Placeholder logic
 # -------------------------
+_status_pending = None
+_status_last = ""
+
+def set_status(msg):
+    """Queue a status bar message; only the latest one is written, once per idle tick."""
+    global _status_last, _status_pending
+    _status_last = msg
+    if _status_pending is None:
+        _status_pending = root.after_idle(_flush_status)
+
+def _flush_status():
+    global _status_pending
+    _status_pending = None
+    status_var.set(_status_last)
+
 def placeholder_action(action_name):
     """Generic placeholder action — replace with actual logic later."""
-    status_var.set(f"Action: {action_name}")
+    set_status(f"Action: {action_name}")
     print(f"[PLACEHOLDER] {action_name}")
 
 # -------------------------
@@ -33,14 +53,12 @@ def placeholder_action(action_name):
 # -------------------------
 def select_tool(tool_name):
     global current_tool
+    # Only the previously selected button needs releasing, not the whole toolbar
+    if current_tool is not None:
+        toolbar_buttons[current_tool].state(['!pressed'])
     current_tool = tool_name
-    # Update toolbar button styles/appearance to show selection
-    for name, btn in toolbar_buttons.items():
-        if name == tool_name:
-            btn.state(['pressed'])
-        else:
-            btn.state(['!pressed'])
-    status_var.set(f"Selected tool: {tool_name}")
+    toolbar_buttons[tool_name].state(['pressed'])
+    set_status(f"Selected tool: {tool_name}")
     print(f"Selected tool: {tool_name}")
 
 def cut_tool():
@@ -59,7 +77,7 @@ def adjust_tool():
 def import_video():
     filename = filedialog.askopenfilename(
         title="Import Video",
-        filetypes=[("Video Files", "*.mp4 *.avi *.mov *.mkv"), ("All Files", "*.*")]
+        filetypes=IMPORT_FILETYPES
     )
     if filename:
         placeholder_action(f"Imported video: {filename}")
@@ -68,7 +86,7 @@ def export_video():
     filename = filedialog.asksaveasfilename(
         title="Export Video",
         defaultextension=".mp4",
-        filetypes=[("MP4 Video", "*.mp4"), ("All Files", "*.*")]
+        filetypes=EXPORT_FILETYPES
     )
     if filename:
         placeholder_action(f"Exported video to: {filename}")
@@ -76,29 +94,50 @@ def export_video():
 # -------------------------
 # Adjustment callbacks
 # -------------------------
-def update_adjustment(var_name, *_):
-    """Called when an adjustment slider changes."""
-    val = adjustments_vars[var_name].get()
-    status_var.set(f"{var_name.capitalize()}: {val:.2f}")
+SLIDER_INTERVAL_MS = 16  # ~60Hz; slider drags fire far more often than that
+_slider_pending = {}
+
+def schedule_slider_update(key, callback, *args):
+    """Coalesce bursty slider events: keep the latest args, run callback once per interval."""
+    if key not in _slider_pending:
+        root.after(SLIDER_INTERVAL_MS, _flush_slider_update, key)
+    _slider_pending[key] = (callback, args)
+
+def _flush_slider_update(key):
+    callback, args = _slider_pending.pop(key)
+    callback(*args)
+
+def update_adjustment(var_name, val_lbl, val):
+    """Called (throttled) when an adjustment slider changes."""
+    val = float(val)
+    val_lbl.configure(text=f"{val:.2f}")
+    set_status(f"{var_name.capitalize()}: {val:.2f}")
     # In a real editor, we'd apply adjustment to preview here
     print(f"[ADJUST] {var_name} = {val:.2f}")
 
-def update_color(var_name, *_):
-    """Color mixer slider changed."""
-    val = color_vars[var_name].get()
-    status_var.set(f"{var_name.upper()}: {int(val)}")
-    print(f"[COLOR] {var_name.upper()} = {int(val)}")
+def update_color(var_name, val_lbl, val):
+    """Color mixer slider changed (throttled)."""
+    val = int(float(val))
+    val_lbl.configure(text=f"{val}")
+    set_status(f"{var_name.upper()}: {val}")
+    print(f"[COLOR] {var_name.upper()} = {val}")
 
 # -------------------------
 # Collapsible sections utils
 # -------------------------
 def toggle_frame(frame_container, toggle_btn):
-    """Toggle visibility of a frame inside a container (pack/grid aware)."""
-    if frame_container.winfo_viewable():
+    """Toggle visibility of a frame inside a container; its rows are built on first expand."""
+    # Open state is tracked on the button rather than queried from Tk (sections start closed)
+    toggle_btn.is_open = not getattr(toggle_btn, 'is_open', False)
+    if not toggle_btn.is_open:
         frame_container.forget()
         toggle_btn.configure(text="► " + toggle_btn.original_text)
     else:
-        frame_container.pack(fill="x", padx=6, pady=(0,6))
+        if not frame_container._built:
+            frame_container.build()
+            frame_container._built = True
+        # Re-pack right below the section header so sections keep their order
+        frame_container.pack(fill="x", padx=6, pady=(0,6), after=toggle_btn.master)
         toggle_btn.configure(text="▼ " + toggle_btn.original_text)
 
 # -------------------------
@@ -110,6 +149,13 @@ root.geometry("1200x750")
 root.minsize(900, 600)
 root.iconbitmap("icon.ico")
 
+# Named fonts: created once, looked up by name. Keep these references alive — Tk deletes a named font when its Font object is collected
+FONT_UI = tkfont.Font(root=root, name="UI", family="Segoe UI", size=10)
+FONT_BOLD_9 = tkfont.Font(root=root, name="UIBold9", family="Segoe UI", size=9, weight="bold")
+FONT_BOLD_10 = tkfont.Font(root=root, name="UIBold10", family="Segoe UI", size=10, weight="bold")
+FONT_BOLD_11 = tkfont.Font(root=root, name="UIBold11", family="Segoe UI", size=11, weight="bold")
+FONT_PREVIEW = tkfont.Font(root=root, name="UIPreview", family="Segoe UI", size=14)
+
 
 # -------------------------
 # Dark theme styling
@@ -124,15 +170,25 @@ TEXT_COLOR = "#e6eef6"
 SUBTEXT = "#9aa6b2"
 
 root.configure(bg=DARK_BG)
-style.configure('.', background=DARK_BG, foreground=TEXT_COLOR, font=('Segoe UI', 10))
-style.configure('TFrame', background=DARK_PANEL)
-style.configure('TLabel', background=DARK_PANEL, foreground=TEXT_COLOR)
-style.configure('TButton', relief='flat', padding=6)
-style.map('TButton', background=[('active', '#333438')])
-style.configure('Tool.TButton', background=DARK_PANEL, foreground=TEXT_COLOR)
-style.configure('TLabelFrame', background=DARK_PANEL, foreground=TEXT_COLOR)
-style.configure('TScale', background=DARK_PANEL)
-style.configure('Status.TLabel', background=DARK_BG, foreground=SUBTEXT)
+STYLES = {
+    '.': {'background': DARK_BG, 'foreground': TEXT_COLOR, 'font': "UI"},
+    'TFrame': {'background': DARK_PANEL},
+    'TLabel': {'background': DARK_PANEL, 'foreground': TEXT_COLOR},
+    'TButton': {'relief': 'flat', 'padding': 6},
+    'Tool.TButton': {'background': DARK_PANEL, 'foreground': TEXT_COLOR},
+    'Slider.Horizontal.TScale': {'background': DARK_PANEL, 'troughcolor': '#333438'},
+    'Status.TLabel': {'background': DARK_BG, 'foreground': SUBTEXT},
+    'Toolbar.TLabel': {'font': "UIBold9"},
+    'Section.TLabel': {'font': "UIBold10"},
+    'Header.TLabel': {'font': "UIBold11"},
+}
+STYLE_MAPS = {
+    'TButton': {'background': [('active', '#333438')]},
+}
+for style_name, opts in STYLES.items():
+    style.configure(style_name, **opts)
+    if style_name in STYLE_MAPS:
+        style.map(style_name, **STYLE_MAPS[style_name])
 
 # -------------------------
 # Top menu bar
@@ -179,28 +235,35 @@ main_paned.add(right_frame, weight=1)
 # -------------------------
 # Left toolbar (emoji icons + Import/Export)
 # -------------------------
-toolbar_label = ttk.Label(left_frame, text="TOOLS", anchor="center", font=('Segoe UI', 9, 'bold'))
+toolbar_label = ttk.Label(left_frame, text="TOOLS", anchor="center", style='Toolbar.TLabel')
 toolbar_label.pack(fill='x', pady=(6,4))
 
 toolbar_buttons = {}
 current_tool = None
 
-def make_toolbar_button(parent, name, emoji, command):
-    btn = ttk.Button(parent, text=f"{emoji}\n{name}", style='Tool.TButton', command=lambda: [command(), select_tool(name)])
+def make_toolbar_button(parent, name, emoji, command, selects=True):
+    click = command
+    if selects:
+        def click():
+            command()
+            select_tool(name)
+    btn = ttk.Button(parent, text=f"{emoji}\n{name}", style='Tool.TButton', command=click)
     btn.pack(fill='x', pady=6, padx=6)
-    toolbar_buttons[name] = btn
+    if selects:
+        toolbar_buttons[name] = btn
     return btn
 
-# Tools
-make_toolbar_button(left_frame, "Cut", "✂️", cut_tool)
-make_toolbar_button(left_frame, "Move", "🖱️", move_tool)
-make_toolbar_button(left_frame, "Add Text", "🅰️", add_text_tool)
-make_toolbar_button(left_frame, "Adjust", "⚙️", adjust_tool)
-# Import/Export buttons (these don’t select tools)
-imp_btn = ttk.Button(left_frame, text="📁\nImport", style='Tool.TButton', command=import_video)
-imp_btn.pack(fill='x', pady=6, padx=6)
-exp_btn = ttk.Button(left_frame, text="💾\nExport", style='Tool.TButton', command=export_video)
-exp_btn.pack(fill='x', pady=6, padx=6)
+# (name, emoji, command, selects tool) — Import/Export don't select tools
+TOOLS = [
+    ("Cut", "✂️", cut_tool, True),
+    ("Move", "🖱️", move_tool, True),
+    ("Add Text", "🅰️", add_text_tool, True),
+    ("Adjust", "⚙️", adjust_tool, True),
+    ("Import", "📁", import_video, False),
+    ("Export", "💾", export_video, False),
+]
+for tool in TOOLS:
+    make_toolbar_button(left_frame, *tool)
 
 # -------------------------
 # Middle top: Video preview
@@ -208,19 +271,32 @@ exp_btn.pack(fill='x', pady=6, padx=6)
 preview_container = ttk.Frame(mid_paned)
 mid_paned.add(preview_container, weight=3)
 
-preview_label = ttk.Label(preview_container, text="Preview", font=('Segoe UI', 11, 'bold'))
+preview_label = ttk.Label(preview_container, text="Preview", style='Header.TLabel')
 preview_label.pack(anchor='nw', padx=6, pady=(6,0))
 
 preview_canvas = tk.Canvas(preview_container, bg="#0f1113", highlightthickness=0)
 preview_canvas.pack(fill='both', expand=True, padx=6, pady=6)
 
-def draw_preview_placeholder(event=None):
-    preview_canvas.delete("all")
+# Placeholder items are created once and only moved on resize
+preview_rect = preview_canvas.create_rectangle(10, 10, 10, 10, outline="#2e2f33", width=2)
+preview_text = preview_canvas.create_text(0, 0, text="Video Preview\n(placeholder)", fill=SUBTEXT, font="UIPreview", justify='center')
+_preview_pending = None
+
+def draw_preview_placeholder():
+    global _preview_pending
+    _preview_pending = None
     w = preview_canvas.winfo_width()
     h = preview_canvas.winfo_height()
-    preview_canvas.create_rectangle(10, 10, w-10, h-10, outline="#2e2f33", width=2)
-    preview_canvas.create_text(w//2, h//2, text="Video Preview\n(placeholder)", fill=SUBTEXT, font=('Segoe UI', 14), justify='center')
-preview_canvas.bind("<Configure>", draw_preview_placeholder)
+    preview_canvas.coords(preview_rect, 10, 10, w-10, h-10)
+    preview_canvas.coords(preview_text, w//2, h//2)
+
+def on_preview_configure(event=None):
+    # A resize drag floods <Configure>; only lay out once it settles
+    global _preview_pending
+    if _preview_pending is not None:
+        preview_canvas.after_cancel(_preview_pending)
+    _preview_pending = preview_canvas.after(50, draw_preview_placeholder)
+preview_canvas.bind("<Configure>", on_preview_configure)
 
 controls_frame = ttk.Frame(preview_container)
 controls_frame.pack(fill='x', padx=6, pady=(0,6))
@@ -235,7 +311,7 @@ ttk.Button(controls_frame, text="⏭️ Next", command=lambda: placeholder_actio
 timeline_container = ttk.Frame(mid_paned)
 mid_paned.add(timeline_container, weight=1)
 
-timeline_label = ttk.Label(timeline_container, text="Timeline", font=('Segoe UI', 10, 'bold'))
+timeline_label = ttk.Label(timeline_container, text="Timeline", style='Section.TLabel')
 timeline_label.pack(anchor='nw', padx=6, pady=(6,0))
 
 timeline_canvas_frame = ttk.Frame(timeline_container)
@@ -246,110 +322,140 @@ h_scroll.pack(side='bottom', fill='x')
 
 timeline_canvas = tk.Canvas(timeline_canvas_frame, height=140, bg="#141517", highlightthickness=0, xscrollcommand=h_scroll.set)
 timeline_canvas.pack(side='left', fill='both', expand=True)
-h_scroll.config(command=timeline_canvas.xview)
 
-timeline_inner = ttk.Frame(timeline_canvas)
-timeline_window = timeline_canvas.create_window((0,0), window=timeline_inner, anchor='nw')
-
-def populate_timeline():
-    for i in range(12):
-        block = ttk.Frame(timeline_inner, width=180, height=90, style='TFrame')
-        block.grid(row=0, column=i, padx=6, pady=12)
-        block.pack_propagate(False)
-        lbl = ttk.Label(block, text=f"Clip {i+1}\n00:0{i}:00", anchor='center')
-        lbl.pack(expand=True)
-    timeline_inner.update_idletasks()
-    timeline_canvas.configure(scrollregion=timeline_canvas.bbox("all"))
+# Clip block layout (canvas px)
+CLIP_WIDTH = 180
+CLIP_HEIGHT = 90
+CLIP_PADX = 6
+CLIP_PADY = 12
+
+# Clip data kept as parallel lists sorted by start (canvas px); only visible clips get drawn
+clip_starts = []
+clip_durations = []
+clip_ends = []
+clip_labels = []
+timeline_width = 0
+
+def populate_timeline(n=12):
+    global timeline_width
+    for i in range(n):
+        x0 = CLIP_PADX + i*(CLIP_WIDTH + 2*CLIP_PADX)
+        clip_starts.append(x0)
+        clip_durations.append(CLIP_WIDTH)
+        clip_ends.append(x0 + CLIP_WIDTH)
+        clip_labels.append(f"Clip {i+1}\n00:0{i}:00")
+    # Bounds come straight from the layout; no geometry pass or bbox("all") walk needed
+    timeline_width = (clip_ends[-1] + CLIP_PADX) if clip_ends else 0
+    timeline_canvas.configure(scrollregion=(0, 0, timeline_width, CLIP_HEIGHT + 2*CLIP_PADY))
+    redraw_timeline()
+
+def redraw_timeline(event=None):
+    """Redraw only the clips intersecting the visible x-range of the timeline."""
+    xv0, xv1 = timeline_canvas.xview()
+    px0 = xv0 * timeline_width
+    px1 = xv1 * timeline_width
+    timeline_canvas.delete("clip")
+    y0 = CLIP_PADY
+    y1 = CLIP_PADY + CLIP_HEIGHT
+    for i in range(bisect_left(clip_ends, px0), len(clip_starts)):
+        x0 = clip_starts[i]
+        if x0 > px1:
+            break
+        x1 = x0 + clip_durations[i]
+        timeline_canvas.create_rectangle(x0, y0, x1, y1, fill=DARK_PANEL, outline="", tags="clip")
+        timeline_canvas.create_text((x0+x1)//2, (y0+y1)//2, text=clip_labels[i], fill=TEXT_COLOR, font="UI", justify='center', tags="clip")
+
+def on_timeline_scroll(*args):
+    timeline_canvas.xview(*args)
+    redraw_timeline()
+
+_timeline_pending = None
+
+def _do_timeline_resize():
+    global _timeline_pending
+    _timeline_pending = None
+    redraw_timeline()
+
+def on_timeline_configure(event=None):
+    # Same as the preview: redraw once per resize burst, not per <Configure>
+    global _timeline_pending
+    if _timeline_pending is not None:
+        timeline_canvas.after_cancel(_timeline_pending)
+    _timeline_pending = timeline_canvas.after(50, _do_timeline_resize)
+
+h_scroll.config(command=on_timeline_scroll)
+timeline_canvas.bind("<Configure>", on_timeline_configure)
 
 populate_timeline()
 
-def resize_timeline_canvas(event):
-    timeline_canvas.itemconfig(timeline_window, height=timeline_canvas.winfo_height())
-    timeline_canvas.configure(scrollregion=timeline_canvas.bbox("all"))
-
-timeline_canvas.bind("<Configure>", resize_timeline_canvas)
-
 # -------------------------
 # Right: Properties panel with collapsible sections
 # -------------------------
-prop_label = ttk.Label(right_frame, text="Properties", font=('Segoe UI', 11, 'bold'))
+prop_label = ttk.Label(right_frame, text="Properties", style='Header.TLabel')
 prop_label.pack(anchor='nw', padx=6, pady=(6,4))
 
-prop_scroll_canvas = tk.Canvas(right_frame, bg=DARK_PANEL, highlightthickness=0)
-prop_scroll_canvas.pack(fill='both', expand=True, padx=6, pady=(0,6))
-
-prop_scrollbar = ttk.Scrollbar(right_frame, orient='vertical', command=prop_scroll_canvas.yview)
-prop_scrollbar.pack(side='right', fill='y')
-prop_scroll_canvas.configure(yscrollcommand=prop_scrollbar.set)
-
-prop_inner = ttk.Frame(prop_scroll_canvas)
-prop_window = prop_scroll_canvas.create_window((0,0), window=prop_inner, anchor='nw', width=300)
-
-def on_prop_configure(event):
-    prop_scroll_canvas.configure(scrollregion=prop_scroll_canvas.bbox("all"))
-prop_inner.bind("<Configure>", on_prop_configure)
+# Both sections fit the panel height even when expanded, so no scrolling canvas is needed
+prop_inner = ttk.Frame(right_frame)
+prop_inner.pack(fill='both', expand=True, padx=6, pady=(0,6))
 
+# Collapsible sections start closed; their slider rows are only created on first expand
 # Adjustments collapsible section
 adjust_header = ttk.Frame(prop_inner)
 adjust_header.pack(fill='x', pady=(6,2))
-adjust_toggle = ttk.Button(adjust_header, text="▼ Adjustments", style='Tool.TButton')
+adjust_toggle = ttk.Button(adjust_header, text="► Adjustments", style='Tool.TButton')
 adjust_toggle.original_text = "Adjustments"
 adjust_toggle.pack(side='left', anchor='w')
 
 adjust_frame = ttk.Frame(prop_inner, relief='flat')
-adjust_frame.pack(fill='x', padx=6, pady=(0,6))
 
 adjustment_names = ["brightness", "contrast", "shadows", "highlights", "whites", "blacks", "levels"]
 adjustments_vars = {}
-for name in adjustment_names:
-    frame = ttk.Frame(adjust_frame)
-    frame.pack(fill='x', pady=4)
-    lbl = ttk.Label(frame, text=name.capitalize(), width=12)
-    lbl.pack(side='left')
-    var = tk.DoubleVar(value=0.0 if name != "levels" else 1.0)
-    adjustments_vars[name] = var
-    scale = ttk.Scale(frame, from_=-100, to=100, orient='horizontal', variable=var,
-                      command=lambda val, n=name: update_adjustment(n))
-    scale.pack(side='left', fill='x', expand=True, padx=6)
-    val_lbl = ttk.Label(frame, textvariable=tk.StringVar(value=str(var.get())), width=6)
-    def make_updater(v, dest_label):
-        def updater(*_):
-            dest_label.configure(text=f"{v.get():.2f}")
-        return updater
-    var.trace_add('write', make_updater(var, val_lbl))
-    val_lbl.pack(side='right')
 
+def build_adjustments():
+    for name in adjustment_names:
+        frame = ttk.Frame(adjust_frame)
+        frame.pack(fill='x', pady=4)
+        lbl = ttk.Label(frame, text=name.capitalize(), width=12)
+        lbl.pack(side='left')
+        var = tk.DoubleVar(value=0.0 if name != "levels" else 1.0)
+        adjustments_vars[name] = var
+        val_lbl = ttk.Label(frame, text=f"{var.get():.2f}", width=6)
+        scale = ttk.Scale(frame, from_=-100, to=100, orient='horizontal', variable=var, style='Slider.Horizontal.TScale',
+                          command=partial(schedule_slider_update, name, update_adjustment, name, val_lbl))
+        scale.pack(side='left', fill='x', expand=True, padx=6)
+        val_lbl.pack(side='right')
+
+adjust_frame.build = build_adjustments
+adjust_frame._built = False
 adjust_toggle.configure(command=lambda: toggle_frame(adjust_frame, adjust_toggle))
 
 # Color Mixer collapsible section
 color_header = ttk.Frame(prop_inner)
 color_header.pack(fill='x', pady=(4,2))
-color_toggle = ttk.Button(color_header, text="▼ Color Mixer", style='Tool.TButton')
+color_toggle = ttk.Button(color_header, text="► Color Mixer", style='Tool.TButton')
 color_toggle.original_text = "Color Mixer"
 color_toggle.pack(side='left', anchor='w')
 
 color_frame = ttk.Frame(prop_inner, relief='flat')
-color_frame.pack(fill='x', padx=6, pady=(0,6))
 
 color_vars = {}
-for name in ['r', 'g', 'b']:
-    frame = ttk.Frame(color_frame)
-    frame.pack(fill='x', pady=4)
-    lbl = ttk.Label(frame, text=name.upper(), width=3)
-    lbl.pack(side='left')
-    var = tk.IntVar(value=128)
-    color_vars[name] = var
-    scale = ttk.Scale(frame, from_=0, to=255, orient='horizontal', variable=var,
-                      command=lambda val, n=name: update_color(n))
-    scale.pack(side='left', fill='x', expand=True, padx=6)
-    val_lbl = ttk.Label(frame, textvariable=tk.StringVar(value=str(var.get())), width=4)
-    def make_color_updater(v, dest_label):
-        def updater(*_):
-            dest_label.configure(text=f"{v.get()}")
-        return updater
-    var.trace_add('write', make_color_updater(var, val_lbl))
-    val_lbl.pack(side='right')
 
+def build_color_mixer():
+    for name in ['r', 'g', 'b']:
+        frame = ttk.Frame(color_frame)
+        frame.pack(fill='x', pady=4)
+        lbl = ttk.Label(frame, text=name.upper(), width=3)
+        lbl.pack(side='left')
+        var = tk.IntVar(value=128)
+        color_vars[name] = var
+        val_lbl = ttk.Label(frame, text=f"{var.get()}", width=4)
+        scale = ttk.Scale(frame, from_=0, to=255, orient='horizontal', variable=var, style='Slider.Horizontal.TScale',
+                          command=partial(schedule_slider_update, name, update_color, name, val_lbl))
+        scale.pack(side='left', fill='x', expand=True, padx=6)
+        val_lbl.pack(side='right')
+
+color_frame.build = build_color_mixer
+color_frame._built = False
 color_toggle.configure(command=lambda: toggle_frame(color_frame, color_toggle))
 
 # -------------------------
@@ -362,15 +468,6 @@ status_bar.pack(side='bottom', fill='x')
 # Call select_tool AFTER status_var is created to avoid errors
 select_tool("Move")
 
-# -------------------------
-# Responsive resizing behavior
-# -------------------------
-root.update_idletasks()
-for i in range(3):
-    root.grid_rowconfigure(i, weight=1)
-for i in range(3):
-    root.grid_columnconfigure(i, weight=1)
-
 # -------------------------
 # Keyboard shortcuts
 # -------------------------